@@ -0,0 +1,174 @@
+# cython: language_level=3, c_api_binop_methods=False
+"""
+Compiled CompleteNumber. complete_numbers.py uses this class in place of its
+pure-Python one whenever the extension has been built, e.g. with
+
+    cythonize -i src/_complete_numbers_c.pyx
+
+The four parts are C doubles and the operators write them straight into a
+new object, so no Python __init__ or float() coercion runs per result.
+"""
+cimport cython
+
+# Supplied by complete_numbers through _bind(), to avoid a circular import
+cdef object CompleteComponent = None
+cdef object _ScalarScaled = None
+
+# Must match the component tags in complete_numbers
+cdef object _REAL = 0
+cdef object _IMAG = 1
+
+
+def _bind(component_cls, scaled_cls):
+    global CompleteComponent, _ScalarScaled
+    CompleteComponent = component_cls
+    _ScalarScaled = scaled_cls
+
+
+cdef bint _is_real(object other):
+    # Only reached for operands that are not exactly int or float
+    import numbers
+    return isinstance(other, numbers.Real)
+
+
+cdef inline CompleteNumber _new(double real, double imag, double u_real, double u_imag):
+    cdef CompleteNumber obj = CompleteNumber.__new__(CompleteNumber)
+    obj._real = real
+    obj._imag = imag
+    obj._u_real = u_real
+    obj._u_imag = u_imag
+    return obj
+
+
+@cython.freelist(64)
+cdef class CompleteNumber:
+    """
+    Complex number that keeps the components absorbed by multiplication by zero.
+    Instances are never mutated after construction, so they can be shared.
+    """
+    cdef readonly double _real, _imag, _u_real, _u_imag
+    cdef object _real_c, _imag_c
+
+    def __init__(self, real, imag, u_real=0, u_imag=0):
+        self._real = float(real)
+        self._imag = float(imag)
+        self._u_real = float(u_real)
+        self._u_imag = float(u_imag)
+
+    @property
+    def real(self):
+        if self._real_c is None:
+            self._real_c = CompleteComponent(self._real, _REAL)
+        return self._real_c
+
+    @property
+    def imag(self):
+        if self._imag_c is None:
+            self._imag_c = CompleteComponent(self._imag, _IMAG)
+        return self._imag_c
+
+    @classmethod
+    def _raw(cls, double real, double imag, double u_real, double u_imag):
+        return _new(real, imag, u_real, u_imag)
+
+    @classmethod
+    def combine_vanished(cls, numbers):
+        """
+        Add up the absorbed components of many complete numbers into a
+        single vanished number, without building intermediate results.
+        """
+        cdef double u_real = 0.0
+        cdef double u_imag = 0.0
+        cdef CompleteNumber cn
+        for cn in numbers:
+            u_real += cn._u_real
+            u_imag += cn._u_imag
+        return _new(0.0, 0.0, u_real, u_imag)
+
+    cdef CompleteNumber _mul(self, double other):
+        if other == 0.0:
+            # Whole number times zero -> both components go to U
+            return _new(0.0, 0.0, self._real, self._imag)
+        # Regular multiplication, absorbed parts scale like in division
+        return _new(self._real * other, self._imag * other,
+                    self._u_real * other, self._u_imag * other)
+
+    def __mul__(self, other):
+        if type(other) is not float and type(other) is not int and not _is_real(other):
+            return NotImplemented
+        return self._mul(other)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def lazy(self):
+        """
+        Return a deferred multiplier for this number. A chain such as
+        cu.lazy() * a * b * c folds a * b * c into one factor and builds a
+        single CompleteNumber on materialize().
+        """
+        return _ScalarScaled(self, 1.0)
+
+    def __truediv__(self, other):
+        """
+        Complete number division. Raises ZeroDivisionError if any non-absorbed
+        components would be divided by zero.
+        """
+        cdef double s
+        if type(other) is not float and type(other) is not int and not _is_real(other):
+            return NotImplemented
+        s = other
+        if s == 0.0:
+            # If there are any non-absorbed components, division by zero is undefined
+            if self._real != 0.0 or self._imag != 0.0:
+                raise ZeroDivisionError("division by zero")
+            # Only absorbed components present
+            return _new(self._u_real, self._u_imag, 0.0, 0.0)
+        # Regular division
+        return _new(self._real / s, self._imag / s, self._u_real / s, self._u_imag / s)
+
+    def __rtruediv__(self, other):
+        """
+        Implement reverse division, e.g. 1 / CompleteNumber. Raises
+        ZeroDivisionError if there are no non-absorbed components to divide by.
+        Absorbed components have no reciprocal, so numbers carrying them are
+        not supported as divisors.
+        """
+        cdef object dividend = other
+        cdef object divisor
+        if type(other) is not float and type(other) is not int:
+            if not _is_real(other):
+                return NotImplemented
+            dividend = float(other)
+        if self._real == 0.0 and self._imag == 0.0:
+            raise ZeroDivisionError("division by zero")
+        if self._u_real != 0.0 or self._u_imag != 0.0:
+            return NotImplemented
+        # Divide as Python complex objects: C complex division handles inf
+        # operands differently, e.g. inf / (1 + 0j) is inf + nanj in Python
+        divisor = complex(self._real, self._imag)
+        quotient = dividend / divisor
+        return _new(quotient.real, quotient.imag, 0.0, 0.0)
+
+    def __repr__(self):
+        # Same text as the pure-Python version; the parts are formatted as
+        # Python floats
+        parts = []
+        if self._real != 0 or (self._imag == 0 and self._u_real == 0 and self._u_imag == 0):
+            parts.append(str(self._real))
+        if self._imag != 0:
+            parts.append(f"{self._imag}j")
+        if self._u_real != 0:
+            parts.append(f"{self._u_real}u")
+        if self._u_imag != 0:
+            parts.append(f"{self._u_imag}uj")
+        return " + ".join(parts).replace(" + -", " - ")
+
+
+def mul_scalar(CompleteNumber cu, double s):
+    """
+    Multiply a CompleteNumber by an int or float without operator dispatch.
+    Callers that already know their operand types can use this directly;
+    CompleteNumber.__mul__ is a thin wrapper around it.
+    """
+    return cu._mul(s)
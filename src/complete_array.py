@@ -0,0 +1,362 @@
+# # Complete Array Usage Patterns
+# arr = CompleteArray([3, 5], [4, 0])      # Create from real and imaginary columns
+# arr = CompleteArray.from_objects(cus)    # Batch-convert a list of CompleteNumbers
+# arr * 0      -> [3u + 4uj, 5u]           # Every number times zero
+# (arr * 0) / 0 -> [3 + 4j, 5]             # Recover the vanished structure
+# arr.to_objects() -> [CompleteNumber, ...]
+
+import numpy as np
+
+from complete_numbers import CompleteNumber, _is_real
+
+try:
+    from numba import njit, prange, float64, void
+    from numba.types import UniTuple
+except ImportError:
+    njit = None
+
+if njit is not None:
+    # Kernels work in place on four C-contiguous 1-D columns. The test on the
+    # scalar is hoisted out of the loops so each loop body is straight-line
+    # code LLVM can vectorize. Explicit signatures compile them at import and
+    # cache=True keeps the compiled code between runs.
+    #
+    # The elementwise kernels run without fastmath: its nnan/ninf flags let
+    # LLVM fold "scalar == 0.0" to true for nan, and the results must match
+    # the NumPy fallback and CompleteNumber on nan and inf. The reduction only
+    # needs reassoc to vectorize, which keeps nan and inf semantics intact.
+    _COLUMN = float64[::1]
+
+    @njit(void(_COLUMN, _COLUMN, _COLUMN, _COLUMN, float64),
+          cache=True, parallel=True)
+    def _mul_scalar_kernel(real, imag, u_real, u_imag, scalar):
+        n = real.shape[0]
+        if scalar == 0.0:
+            for k in prange(n):
+                u_real[k] = real[k]
+                u_imag[k] = imag[k]
+                real[k] = 0.0
+                imag[k] = 0.0
+        else:
+            for k in prange(n):
+                real[k] *= scalar
+                imag[k] *= scalar
+                u_real[k] *= scalar
+                u_imag[k] *= scalar
+
+    @njit(void(_COLUMN, _COLUMN, _COLUMN, _COLUMN, _COLUMN),
+          cache=True, parallel=True)
+    def _mul_array_kernel(real, imag, u_real, u_imag, other):
+        # Branchless: each zero test is a conditional expression that LLVM
+        # turns into a vector select, so every lane runs the same code. A
+        # select, unlike multiplying by a 0/1 mask, never computes inf * 0
+        for k in prange(real.shape[0]):
+            s = other[k]
+            zero = s == 0.0
+            r = real[k]
+            i = imag[k]
+            u_real[k] = r if zero else u_real[k] * s
+            u_imag[k] = i if zero else u_imag[k] * s
+            real[k] = 0.0 if zero else r * s
+            imag[k] = 0.0 if zero else i * s
+
+    @njit(void(_COLUMN, _COLUMN, _COLUMN, _COLUMN, float64),
+          cache=True, parallel=True)
+    def _div_scalar_kernel(real, imag, u_real, u_imag, scalar):
+        # The caller has already checked that real and imag are all zero
+        # when dividing by zero
+        n = real.shape[0]
+        if scalar == 0.0:
+            for k in prange(n):
+                real[k] = u_real[k]
+                imag[k] = u_imag[k]
+                u_real[k] = 0.0
+                u_imag[k] = 0.0
+        else:
+            for k in prange(n):
+                real[k] /= scalar
+                imag[k] /= scalar
+                u_real[k] /= scalar
+                u_imag[k] /= scalar
+
+    @njit(UniTuple(float64, 2)(_COLUMN, _COLUMN),
+          cache=True, fastmath={'reassoc'}, parallel=True)
+    def _combine_vanished_kernel(u_real, u_imag):
+        # Sums both absorbed columns in a single pass
+        total_u_real = 0.0
+        total_u_imag = 0.0
+        for k in prange(u_real.shape[0]):
+            total_u_real += u_real[k]
+            total_u_imag += u_imag[k]
+        return total_u_real, total_u_imag
+else:
+    _mul_scalar_kernel = _mul_array_kernel = None
+    _div_scalar_kernel = _combine_vanished_kernel = None
+
+
+class CompleteArray:
+    """
+    Batch of complete numbers stored as four parallel float64 columns.
+
+    The columns hold the real, imaginary, absorbed real and absorbed imaginary
+    parts of every number, so operations run over whole arrays instead of
+    dispatching once per CompleteNumber object.
+    """
+    __slots__ = ('_real', '_imag', '_u_real', '_u_imag')
+
+    # Keep NumPy from broadcasting over a CompleteArray on the left of an
+    # ndarray operator, so ndarray * CompleteArray reaches __rmul__
+    __array_ufunc__ = None
+
+    def __init__(self, real, imag, u_real=None, u_imag=None):
+        self._real = np.array(real, dtype=np.float64, order='C')
+        self._imag = np.array(imag, dtype=np.float64, order='C')
+        self._u_real = (np.zeros_like(self._real) if u_real is None
+                        else np.array(u_real, dtype=np.float64, order='C'))
+        self._u_imag = (np.zeros_like(self._real) if u_imag is None
+                        else np.array(u_imag, dtype=np.float64, order='C'))
+        shape = self._real.shape
+        if not (self._imag.shape == self._u_real.shape == self._u_imag.shape == shape):
+            raise ValueError("all columns of a CompleteArray must have the same shape")
+
+    @classmethod
+    def _from_columns(cls, real, imag, u_real, u_imag):
+        """Wrap four float64 columns that are already owned by the new array"""
+        arr = object.__new__(cls)
+        arr._real = real
+        arr._imag = imag
+        arr._u_real = u_real
+        arr._u_imag = u_imag
+        return arr
+
+    def _copy(self):
+        """Copy all four columns into fresh C-contiguous arrays"""
+        return self._from_columns(
+            self._real.copy(),
+            self._imag.copy(),
+            self._u_real.copy(),
+            self._u_imag.copy(),
+        )
+
+    def _flat_columns(self):
+        """1-D views of the four columns, as taken by the Numba kernels"""
+        return (
+            self._real.reshape(-1),
+            self._imag.reshape(-1),
+            self._u_real.reshape(-1),
+            self._u_imag.reshape(-1),
+        )
+
+    @classmethod
+    def from_objects(cls, numbers):
+        """Batch-convert a sequence of CompleteNumbers into a 1-D CompleteArray"""
+        numbers = list(numbers)
+        return cls(
+            [cn._real for cn in numbers],
+            [cn._imag for cn in numbers],
+            [cn._u_real for cn in numbers],
+            [cn._u_imag for cn in numbers],
+        )
+
+    def to_objects(self):
+        """Convert back into a flat list of CompleteNumbers"""
+        # tolist() already yields Python floats, so skip the coercing constructor
+        return [
+            CompleteNumber._raw(r, i, ur, ui)
+            for r, i, ur, ui in zip(
+                self._real.ravel().tolist(),
+                self._imag.ravel().tolist(),
+                self._u_real.ravel().tolist(),
+                self._u_imag.ravel().tolist(),
+            )
+        ]
+
+    @property
+    def shape(self):
+        return self._real.shape
+
+    def __len__(self):
+        return len(self._real)
+
+    def __mul__(self, other):
+        # Same operand rules as CompleteNumber.__mul__, with ndarrays taken
+        # as one factor per number
+        t = type(other)
+        if t is not float and t is not int:
+            if isinstance(other, np.ndarray):
+                return self._mul_elementwise(other)
+            if not _is_real(other):
+                return NotImplemented
+            other = float(other)
+        if _mul_scalar_kernel is not None:
+            result = self._copy()
+            _mul_scalar_kernel(*result._flat_columns(), float(other))
+            return result
+        if other == 0:
+            # Every number times zero -> both components go to U
+            return self._from_columns(
+                np.zeros_like(self._real),
+                np.zeros_like(self._imag),
+                self._real.copy(),
+                self._imag.copy(),
+            )
+        # Regular multiplication, written straight into the new columns
+        result = self._from_columns(
+            np.empty_like(self._real),
+            np.empty_like(self._imag),
+            np.empty_like(self._u_real),
+            np.empty_like(self._u_imag),
+        )
+        np.multiply(self._real, other, out=result._real)
+        np.multiply(self._imag, other, out=result._imag)
+        np.multiply(self._u_real, other, out=result._u_real)
+        np.multiply(self._u_imag, other, out=result._u_imag)
+        return result
+
+    def _mul_elementwise(self, other):
+        """
+        Multiply every number by its own factor from an ndarray of the same
+        shape (or one that broadcasts to it).
+
+        Instead of branching per element on a zero factor, the zero mask is
+        computed once and np.where selects between the absorbed and the
+        multiplied parts, so every number gets the same result as
+        CompleteNumber * factor, including for nan and inf parts.
+        """
+        other = np.array(np.broadcast_to(other, self.shape), dtype=np.float64, order='C')
+        if _mul_array_kernel is not None:
+            result = self._copy()
+            _mul_array_kernel(*result._flat_columns(), other.reshape(-1))
+            return result
+        zero = other == 0
+        return self._from_columns(
+            np.where(zero, 0.0, self._real * other),
+            np.where(zero, 0.0, self._imag * other),
+            np.where(zero, self._real, self._u_real * other),
+            np.where(zero, self._imag, self._u_imag * other),
+        )
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        """
+        Elementwise complete number division. Raises ZeroDivisionError if any
+        number in the array still has non-absorbed components.
+        """
+        t = type(other)
+        if t is not float and t is not int:
+            if not _is_real(other):
+                return NotImplemented
+            other = float(other)
+        is_zero = other == 0
+        if is_zero and np.logical_or(self._real != 0, self._imag != 0).any():
+            # Division by zero is only defined once everything has been absorbed
+            raise ZeroDivisionError("division by zero")
+        if _div_scalar_kernel is not None:
+            result = self._copy()
+            _div_scalar_kernel(*result._flat_columns(), float(other))
+            return result
+        if is_zero:
+            # Only absorbed components present
+            return self._from_columns(
+                self._u_real.copy(),
+                self._u_imag.copy(),
+                np.zeros_like(self._u_real),
+                np.zeros_like(self._u_imag),
+            )
+        result = self._from_columns(
+            np.empty_like(self._real),
+            np.empty_like(self._imag),
+            np.empty_like(self._u_real),
+            np.empty_like(self._u_imag),
+        )
+        np.divide(self._real, other, out=result._real)
+        np.divide(self._imag, other, out=result._imag)
+        np.divide(self._u_real, other, out=result._u_real)
+        np.divide(self._u_imag, other, out=result._u_imag)
+        return result
+
+    def combine_vanished(self):
+        """Add up the absorbed components of every number into one CompleteNumber"""
+        if _combine_vanished_kernel is not None:
+            u_real, u_imag = _combine_vanished_kernel(*self._flat_columns()[2:])
+        else:
+            u_real, u_imag = self._u_real.sum(), self._u_imag.sum()
+        return CompleteNumber(0, 0, u_real, u_imag)
+
+    def __repr__(self):
+        return f"CompleteArray({self.to_objects()!r})"
+
+
+# nan and inf inputs are the point of this check, so NumPy's warnings are noise
+@np.errstate(invalid='ignore')
+def test_kernel_parity():
+    """
+    Check that the Numba kernels, the NumPy fallback and CompleteNumber give
+    the same results, including on nan and inf parts and operands.
+    """
+    print("\nKernel Parity Tests:")
+    inf, nan = float('inf'), float('nan')
+    values = [0.0, -0.0, 1.5, -2.0, inf, -inf, nan]
+    numbers = [
+        CompleteNumber(r, i, ur, ui)
+        for r in values for i in values
+        for ur in (0.0, 3.0, inf) for ui in (0.0, -1.0, nan)
+    ]
+    absorbed = [cn * 0 for cn in numbers]
+    scalars = [0, 0.0, -0.0, 2, -0.5, inf, -inf, nan]
+    # One factor per number for the elementwise multiply, cycling through scalars
+    factors = np.resize(np.array(scalars, dtype=np.float64), len(numbers))
+
+    def evaluate(op):
+        # Result columns, or "ZeroDivisionError" if the operation raised
+        try:
+            result = op()
+        except ZeroDivisionError:
+            return "ZeroDivisionError"
+        if isinstance(result, list):
+            result = CompleteArray.from_objects(result)
+        return result._flat_columns()
+
+    def same(a, b):
+        if isinstance(a, str) or isinstance(b, str):
+            return a == b
+        return all(np.array_equal(x, y, equal_nan=True) for x, y in zip(a, b))
+
+    kernels = (_mul_scalar_kernel, _mul_array_kernel, _div_scalar_kernel, _combine_vanished_kernel)
+
+    def kernel_and_fallback(op):
+        global _mul_scalar_kernel, _mul_array_kernel, _div_scalar_kernel, _combine_vanished_kernel
+        with_kernels = evaluate(op)
+        _mul_scalar_kernel = _mul_array_kernel = _div_scalar_kernel = _combine_vanished_kernel = None
+        try:
+            return with_kernels, evaluate(op)
+        finally:
+            _mul_scalar_kernel, _mul_array_kernel, _div_scalar_kernel, _combine_vanished_kernel = kernels
+
+    checks = []
+    for cus in (numbers, absorbed):
+        arr = CompleteArray.from_objects(cus)
+        for s in scalars:
+            checks.append((f"* {s}",) + kernel_and_fallback(lambda: arr * s)
+                          + (evaluate(lambda: [cn * s for cn in cus]),))
+            checks.append((f"/ {s}",) + kernel_and_fallback(lambda: arr / s)
+                          + (evaluate(lambda: [cn / s for cn in cus]),))
+        checks.append(("* ndarray",) + kernel_and_fallback(lambda: arr * factors)
+                      + (evaluate(lambda: [cn * s for cn, s in zip(cus, factors.tolist())]),))
+        checks.append(("combine_vanished",)
+                      + kernel_and_fallback(lambda: [arr.combine_vanished()])
+                      + (evaluate(lambda: [CompleteNumber.combine_vanished(cus)]),))
+
+    failures = [name for name, kernel, fallback, objects in checks
+                if not (same(kernel, fallback) and same(fallback, objects))]
+    label = ("kernels, NumPy and CompleteNumber" if kernels[0] is not None
+             else "NumPy and CompleteNumber")
+    print(f"{len(checks) - len(failures)}/{len(checks)} operations agree across {label}")
+    for name in failures:
+        print(f"Mismatch: {name}")
+    return failures
+
+if __name__ == "__main__":
+    test_kernel_parity()
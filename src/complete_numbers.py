@@ -12,24 +12,57 @@
 # cu.imag * 0  -> 4uj       # Imaginary component times zero
 # cu * 0      -> 3u + 4uj   # Whole complete number times zero
 
-from typing import Union, Tuple
-import numbers
-import cmath
+from dataclasses import dataclass
+import math
+
+# Component tags carried by CompleteComponent and AbsorbedScalar
+_REAL, _IMAG = 0, 1
+
+def _is_real(other):
+    # Imported here because numbers pulls in the ABC machinery, and only
+    # operands that are not exactly int or float reach this check
+    import numbers
+    return isinstance(other, numbers.Real)
+
+@dataclass(frozen=True)
+class AbsorbedScalar:
+    """
+    Component value absorbed into U; kind is _REAL or _IMAG. Not a tuple, so
+    + and * mean nothing here; do float arithmetic on .value.
+    """
+    __slots__ = ('value', 'kind')
+    value: float
+    kind: int
+
+    def __repr__(self):
+        return f"{self.value}u" if self.kind == _REAL else f"{self.value}uj"
 
 class CompleteComponent:
     """Drop-in replacement for float that maintains absorption into U"""
+    __slots__ = ('_value', '_type', '_zero_result')
+
     def __init__(self, value, component_type):
         self._value = float(value)
-        self._type = component_type    # 'real' or 'imag'
+        self._type = component_type    # _REAL or _IMAG
+        self._zero_result = None       # AbsorbedScalar, built on first * 0
     
     def __mul__(self, other):
-        if other == 0:
-            if self._type == 'real':
-                # Real component times zero -> just the absorbed value
-                return f"{self._value}u"
-            else:  # imaginary
-                # Imaginary component times zero -> just the absorbed value
-                return f"{self._value}uj"
+        t = type(other)
+        if t is float or t is int or _is_real(other):
+            # 0, 0.0, -0.0 and False are all falsy; nan is truthy and
+            # multiplies through as IEEE-754 does
+            is_zero = not other
+        elif isinstance(other, complex):
+            is_zero = other == 0
+        else:
+            # None, "", [] are falsy too but are not multipliers
+            return NotImplemented
+        if is_zero:
+            # Component times zero -> just the absorbed value, tagged _REAL or _IMAG
+            result = self._zero_result
+            if result is None:
+                result = self._zero_result = AbsorbedScalar(self._value, self._type)
+            return result
         else:
             # Non-zero multiplication - return just the float value
             return self._value * other
@@ -50,11 +83,6 @@ class CompleteComponent:
 
     def __rmul__(self, other):
         return self.__mul__(other)
-    
-    def __rtruediv__(self, other):
-        """Implement reverse division"""
-        # This handles cases like 1 / CompleteNumber
-        return NotImplemented  # For now, we'll implement if needed 
 
     def __repr__(self):
         return str(self._value)
@@ -63,60 +91,121 @@ class CompleteComponent:
         return self._value
 
 class CompleteNumber:
+    """
+    Complex number that keeps the components absorbed by multiplication by zero.
+    Instances are never mutated after construction, so they can be shared.
+    """
+    __slots__ = ('_real', '_imag', '_u_real', '_u_imag', '_real_c', '_imag_c')
+
     def __init__(self, real, imag, u_real=0, u_imag=0):
         self._real = float(real)
         self._imag = float(imag)
         self._u_real = float(u_real)
         self._u_imag = float(u_imag)
+        # Component objects are built on first access and reused afterwards
+        self._real_c = None
+        self._imag_c = None
     
     @property
     def real(self):
-        return CompleteComponent(self._real, 'real')
+        if self._real_c is None:
+            self._real_c = CompleteComponent(self._real, _REAL)
+        return self._real_c
     
     @property
     def imag(self):
-        return CompleteComponent(self._imag, 'imag')
+        if self._imag_c is None:
+            self._imag_c = CompleteComponent(self._imag, _IMAG)
+        return self._imag_c
+
+    @classmethod
+    def _raw(cls, real, imag, u_real, u_imag):
+        """Construct from parts that are already floats, skipping coercion"""
+        obj = object.__new__(cls)
+        obj._real = real
+        obj._imag = imag
+        obj._u_real = u_real
+        obj._u_imag = u_imag
+        obj._real_c = None
+        obj._imag_c = None
+        return obj
+
+    @classmethod
+    def combine_vanished(cls, numbers):
+        """
+        Add up the absorbed components of many complete numbers into a
+        single vanished number, without building intermediate results.
+        """
+        u_real = 0.0
+        u_imag = 0.0
+        for cn in numbers:
+            u_real += cn._u_real
+            u_imag += cn._u_imag
+        return cls._raw(0.0, 0.0, u_real, u_imag)
 
     def __mul__(self, other):
-        if isinstance(other, (int, float)):
-            if other == 0:
-                # Whole number times zero -> both components go to U
-                return CompleteNumber(0, 0, self._real, self._imag)
-            else:
-                # Regular multiplication
-                return CompleteNumber(self._real * other, self._imag * other)
+        # Exact-type checks are pointer compares; only other operands pay
+        # for the numbers.Real ABC lookup in _is_real
+        t = type(other)
+        if t is float or t is int:
+            return mul_scalar(self, other)
+        if _is_real(other):
+            return mul_scalar(self, float(other))
         return NotImplemented
+
+    def lazy(self):
+        """
+        Return a deferred multiplier for this number. A chain such as
+        cu.lazy() * a * b * c folds a * b * c into one factor and builds a
+        single CompleteNumber on materialize().
+        """
+        return _ScalarScaled(self, 1.0)
     
     def __truediv__(self, other):
         """
         Complete number division. Raises ZeroDivisionError if any non-absorbed
         components would be divided by zero.
         """
-        if isinstance(other, (int, float)):
-            if other == 0:
-                # If there are any non-absorbed components, division by zero is undefined
-                if self._real != 0 or self._imag != 0:
-                    raise ZeroDivisionError("division by zero")
-                # Only absorbed components present
-                return CompleteNumber(
-                    self._u_real,
-                    self._u_imag
-                )
-            else:
-                # Regular division
-                return CompleteNumber(
-                    self._real / other, 
-                    self._imag / other,
-                    self._u_real / other,
-                    self._u_imag / other
-                )
-        return NotImplemented
+        t = type(other)
+        if t is not float and t is not int:
+            if not _is_real(other):
+                return NotImplemented
+            other = float(other)
+        real, imag, u_real, u_imag = self._real, self._imag, self._u_real, self._u_imag
+        if other == 0:
+            # If there are any non-absorbed components, division by zero is undefined
+            if real != 0 or imag != 0:
+                raise ZeroDivisionError("division by zero")
+            # Only absorbed components present
+            return CompleteNumber._raw(u_real, u_imag, 0.0, 0.0)
+        else:
+            # Regular division
+            return CompleteNumber._raw(
+                real / other,
+                imag / other,
+                u_real / other,
+                u_imag / other
+            )
 
     def __rtruediv__(self, other):
-        """Implement reverse division"""
-        if self._value == 0:
+        """
+        Implement reverse division, e.g. 1 / CompleteNumber. Raises
+        ZeroDivisionError if there are no non-absorbed components to divide by.
+        Absorbed components have no reciprocal, so numbers carrying them are
+        not supported as divisors.
+        """
+        t = type(other)
+        if t is not float and t is not int:
+            if not _is_real(other):
+                return NotImplemented
+            other = float(other)
+        real, imag = self._real, self._imag
+        if real == 0 and imag == 0:
             raise ZeroDivisionError("division by zero")
-        return other / self._value
+        if self._u_real != 0 or self._u_imag != 0:
+            return NotImplemented
+        quotient = other / complex(real, imag)
+        return CompleteNumber._raw(quotient.real, quotient.imag, 0.0, 0.0)
 
     def __rmul__(self, other):
         return self.__mul__(other)
@@ -133,6 +222,80 @@ class CompleteNumber:
             parts.append(f"{self._u_imag}uj")
             
         return " + ".join(parts).replace(" + -", " - ")
+
+def mul_scalar(cu, s):
+    """
+    Multiply a CompleteNumber by an int or float without operator dispatch.
+    Callers that already know their operand types can use this directly;
+    CompleteNumber.__mul__ is a thin wrapper around it.
+
+    Any falsy s (0, 0.0, -0.0, False) absorbs into U. nan and inf take the
+    regular branch and follow IEEE-754, so e.g. a zero part times inf is nan.
+    """
+    t = type(s)
+    if t is not float and t is not int:
+        # Float subclasses such as np.float64 would otherwise end up in the parts
+        s = float(s)
+    real = cu._real
+    imag = cu._imag
+    if not s:
+        # Whole number times zero -> both components go to U
+        return CompleteNumber._raw(0.0, 0.0, real, imag)
+    # Regular multiplication, absorbed parts scale like in division
+    return CompleteNumber._raw(real * s, imag * s, cu._u_real * s, cu._u_imag * s)
+
+class _ScalarScaled:
+    """CompleteNumber with a pending scalar factor, see CompleteNumber.lazy"""
+    __slots__ = ('cu', 'factor')
+
+    def __init__(self, cu, factor):
+        self.cu = cu
+        self.factor = factor
+
+    def __mul__(self, other):
+        # Same operand rules as CompleteNumber.__mul__
+        t = type(other)
+        if t is not float and t is not int:
+            if not _is_real(other):
+                return NotImplemented
+            other = float(other)
+        if other:
+            factor = self.factor * other
+            if not factor or (not math.isfinite(factor) and math.isfinite(other)):
+                # The folded factor underflowed or overflowed although the
+                # step itself did not; apply the pending factor first so the
+                # result matches step-by-step multiplication
+                return _ScalarScaled(self.materialize(), other)
+            return _ScalarScaled(self.cu, factor)
+        # Times zero -> the scaled components go to U
+        return CompleteNumber._raw(
+            0.0, 0.0, self.cu._real * self.factor, self.cu._imag * self.factor)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        return self.materialize() / other
+
+    def materialize(self):
+        """Apply the folded factor and return the resulting CompleteNumber"""
+        if self.factor == 1:
+            return self.cu
+        return mul_scalar(self.cu, self.factor)
+
+    def __repr__(self):
+        return repr(self.materialize())
+
+# Use the compiled CompleteNumber from _complete_numbers_c.pyx when it has been
+# built; the pure-Python classes above remain the fallback
+try:
+    import _complete_numbers_c
+except ImportError:
+    pass
+else:
+    _complete_numbers_c._bind(CompleteComponent, _ScalarScaled)
+    CompleteNumber = _complete_numbers_c.CompleteNumber
+    mul_scalar = _complete_numbers_c.mul_scalar
     
 def test_basic_multiplication():
     """
@@ -212,6 +375,40 @@ def test_basic_division():
     print(f"\nCase 4 - Pure absorbed components / 0:")
     print(f"({cu_absorbed_only}) / 0 = {result4}")  # Should recover original values
 
+    # Test 5: Reverse division by a component
+    result5 = 1 / cu.real
+    print(f"\nCase 5 - Reverse division by a component:")
+    print(f"1 / ({cu}).real = {result5}")  # Should be 1/3
+
+    # Test 6: Reverse division by a whole number
+    result6 = 1 / cu
+    print(f"\nCase 6 - Reverse division by a whole number:")
+    print(f"1 / ({cu}) = {result6}")  # Should be 0.12 - 0.16j
+
+    # Test 7: Reverse division by zero (should raise exception)
+    print(f"\nCase 7 - Reverse division by zero:")
+    cu_zero = CompleteNumber(0, 4)  # 4j, so the real component is 0
+    try:
+        result7 = 1 / cu_zero.real
+        print(f"1 / ({cu_zero}).real = {result7}")
+    except ZeroDivisionError as e:
+        print(f"1 / ({cu_zero}).real -> ZeroDivisionError: {e}")
+    try:
+        result7 = 1 / cu_absorbed
+        print(f"1 / ({cu_absorbed}) = {result7}")
+    except ZeroDivisionError as e:
+        print(f"1 / ({cu_absorbed}) -> ZeroDivisionError: {e}")
+
+    # Test 8: Reverse division by a number carrying absorbed components
+    # (should raise exception, absorbed components have no reciprocal)
+    print(f"\nCase 8 - Reverse division by a number with absorbed components:")
+    cu_mixed = CompleteNumber(3, 4, 1, 0)  # 3 + 4j + 1u
+    try:
+        result8 = 1 / cu_mixed
+        print(f"1 / ({cu_mixed}) = {result8}")
+    except TypeError as e:
+        print(f"1 / ({cu_mixed}) -> TypeError: {e}")
+
     return cu_absorbed, result4
 
 def demonstrate_vanishing_summation():
@@ -237,11 +434,7 @@ def demonstrate_vanishing_summation():
     print(f"Crate: {crate_vanished}")  # Should be 3u - preserving the vanished structure
     
     # Add the vanished quantities (combining our structural information)
-    total_vanished = CompleteNumber(
-        0, 0, 
-        box_vanished._u_real + crate_vanished._u_real,
-        box_vanished._u_imag + crate_vanished._u_imag
-    )
+    total_vanished = CompleteNumber.combine_vanished([box_vanished, crate_vanished])
     print(f"\nCombined vanished structures:")
     print(f"Total: {total_vanished}")  # Should be 8u
     